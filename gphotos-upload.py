@@ -1,14 +1,13 @@
-from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import AuthorizedSession
 from google.oauth2.credentials import Credentials
 import json
+import mimetypes
 import os.path
 import argparse
 import logging
-from tqdm import tqdm
+import sys
 from time import sleep
 import os
-from natsort import natsorted
 
 
 def parse_arguments(arg_input=None):
@@ -42,6 +41,9 @@ def authenticate(scopes):
     Returns:
         Credentials: The user's authentication credentials.
     """
+    # Only needed when no saved tokens exist; importing it is slow
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
     flow = InstalledAppFlow.from_client_secrets_file(
         'client_id.json',
         scopes=scopes)
@@ -123,7 +125,8 @@ def get_albums(session, app_created_only=False):
         dict: A dictionary representing an album.
     """
     params = {
-        'excludeNonAppCreatedData': app_created_only
+        'excludeNonAppCreatedData': app_created_only,
+        'pageSize': 50  # API maximum; the default is 20
     }
 
     while True:
@@ -162,8 +165,9 @@ def create_or_retrieve_album(session, album_title):
             return album_id
 
     # No matches, create new album
-    create_album_body = json.dumps({"album": {"title": album_title}})
-    response = session.post('https://photoslibrary.googleapis.com/v1/albums', data=create_album_body)
+    create_album_body = json.dumps({"album": {"title": album_title}}, separators=(',', ':')).encode()
+    response = session.post('https://photoslibrary.googleapis.com/v1/albums', data=create_album_body,
+                            headers={'Content-Type': 'application/json'})
     response.raise_for_status()
     response_data = response.json()
 
@@ -186,16 +190,16 @@ def upload_photos(session, photo_file_list, album_name):
         photo_file_list (list): A list of photo file paths to upload.
         album_name (str): The name of the album to upload photos to.
     """
+    from tqdm import tqdm
+
     album_id = create_or_retrieve_album(session, album_name) if album_name else None
 
     # Interrupt upload if an upload was requested but could not be created
     if album_name and not album_id:
         return
 
-    session.headers["Content-type"] = "application/octet-stream"
-    session.headers["X-Goog-Upload-Protocol"] = "raw"
-
-    for photo_file_name in tqdm(photo_file_list, desc='Photos'):
+    for photo_file_name in tqdm(photo_file_list, desc='Photos', mininterval=0.5, miniters=1,
+                                disable=not sys.stderr.isatty()):
         try:
             with open(photo_file_name, mode='rb') as photo_file:
                 photo_bytes = photo_file.read()
@@ -203,11 +207,19 @@ def upload_photos(session, photo_file_list, album_name):
             logging.error(f"Could not read file '{photo_file_name}': {err}")
             continue
 
-        session.headers["X-Goog-Upload-File-Name"] = os.path.basename(photo_file_name)
+        upload_headers = {
+            "Content-type": "application/octet-stream",
+            "X-Goog-Upload-Protocol": "raw",
+            "X-Goog-Upload-File-Name": os.path.basename(photo_file_name)
+        }
+        mime_type, _ = mimetypes.guess_type(photo_file_name)
+        if mime_type:
+            upload_headers["X-Goog-Upload-Content-Type"] = mime_type
 
         logging.info(f"Uploading photo: '{photo_file_name}'")
 
-        upload_token_response = session.post('https://photoslibrary.googleapis.com/v1/uploads', data=photo_bytes)
+        upload_token_response = session.post('https://photoslibrary.googleapis.com/v1/uploads', data=photo_bytes,
+                                              headers=upload_headers)
         upload_token_response.raise_for_status()
 
         if upload_token_response.content:
@@ -215,10 +227,11 @@ def upload_photos(session, photo_file_list, album_name):
             create_body = json.dumps({"albumId": album_id,
                                     "newMediaItems": [{"description": "",
                                                      "simpleMediaItem": {"uploadToken": upload_token}}]},
-                                   indent=4)
+                                   separators=(',', ':')).encode()
 
             media_item_response = session.post('https://photoslibrary.googleapis.com/v1/mediaItems:batchCreate',
-                                             data=create_body)
+                                             data=create_body,
+                                             headers={'Content-Type': 'application/json'})
             media_item_response.raise_for_status()
             media_item_data = media_item_response.json()
 
@@ -237,13 +250,6 @@ def upload_photos(session, photo_file_list, album_name):
             logging.error(f"Could not upload '{os.path.basename(photo_file_name)}'. "
                          f"Server Response: {upload_token_response}")
 
-    # Clean up headers
-    for header in ["Content-type", "X-Goog-Upload-Protocol", "X-Goog-Upload-File-Name"]:
-        try:
-            del session.headers[header]
-        except KeyError:
-            pass
-
 
 def upload_photos_from_directory(root_directory):
     """
@@ -253,6 +259,11 @@ def upload_photos_from_directory(root_directory):
     Args:
         root_directory (str): The path to the root directory containing photo albums.
     """
+    from natsort import natsort_keygen
+    from tqdm import tqdm
+
+    nat_key = natsort_keygen()
+
     logging.basicConfig(
         format='%(asctime)s %(module)s.%(funcName)s:%(levelname)s:%(message)s',
         datefmt='%m/%d/%Y %I_%M_%S %p',
@@ -263,13 +274,13 @@ def upload_photos_from_directory(root_directory):
     session = get_authorized_session('client_id.json')
 
     for subdirectory, subdirectories, _ in os.walk(root_directory):
-        for album_name in tqdm(subdirectories, desc='Albums'):
+        for album_name in tqdm(subdirectories, desc='Albums', disable=not sys.stderr.isatty()):
             album_path = os.path.join(subdirectory, album_name)
             logging.info(f"Processing album: {album_name}")
 
             photo_paths = [
                 os.path.abspath(os.path.join(album_path, photo_filename))
-                for photo_filename in natsorted(os.listdir(album_path))
+                for photo_filename in sorted(os.listdir(album_path), key=nat_key)
             ]
             logging.debug(f"Photos in album '{album_name}': {photo_paths}")
 
@@ -1,16 +1,29 @@
 """Google Photos API client implementation."""
 
+import hashlib
 import json
 import logging
+import mimetypes
 import os
-from typing import Generator, List, Optional
-from time import sleep
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Generator, List, Optional, Tuple
 
-from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import AuthorizedSession
 from google.oauth2.credentials import Credentials
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .config import Config
+from .rate_limiter import RateLimiter
 from .exceptions import (
     GooglePhotosError,
     AuthenticationError,
@@ -19,6 +32,46 @@ from .exceptions import (
     APIError
 )
 
+# Bytes hashed from each end of a file to detect duplicate uploads
+_CONTENT_KEY_SAMPLE_SIZE = 64 * 1024
+
+class _ApiRetry(Retry):
+    """Retry policy for Google Photos API requests.
+    
+    POSTs are only retried on statuses that mean the request was not
+    processed, so album and media item creation is never replayed.
+    Backoff is exponential, capped, and jittered so concurrent uploads don't
+    retry in lockstep after a 429. A Retry-After header, when present,
+    still takes precedence. Each retry also waits on the client's rate
+    limiter, like the first attempt does.
+    """
+    
+    BACKOFF_CAP = 60  # seconds
+    POST_RETRY_STATUSES = frozenset([429, 503])
+    
+    def __init__(self, *args, rate_limiter: Optional[RateLimiter] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.rate_limiter = rate_limiter
+    
+    def new(self, **kwargs) -> "_ApiRetry":
+        retry = super().new(**kwargs)
+        retry.rate_limiter = self.rate_limiter
+        return retry
+    
+    def sleep(self, response=None) -> None:
+        # Retries are sent by urllib3 directly, so they wait on the limiter here
+        super().sleep(response)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+    
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method == "POST" and status_code not in self.POST_RETRY_STATUSES:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+    
+    def get_backoff_time(self) -> float:
+        return min(self.BACKOFF_CAP, super().get_backoff_time()) + random.random()
+
 class GooglePhotosClient:
     """Client for interacting with the Google Photos API."""
     
@@ -31,8 +84,16 @@ class GooglePhotosClient:
         """
         self.config = config
         self.auth_file = auth_file
-        self.session = self._get_authorized_session()
+        self._albums_url = f"{config.API_BASE_URL}/albums"
+        self._uploads_url = f"{config.API_BASE_URL}/uploads"
+        self._batch_create_url = f"{config.API_BASE_URL}/mediaItems:batchCreate"
+        self._album_index: Optional[Dict[str, str]] = None
+        self._album_lock = threading.Lock()
+        self._token_cache: Dict[str, Tuple[str, str, float]] = {}
+        self._token_cache_lock = threading.Lock()
+        self.rate_limiter = RateLimiter(config.REQUESTS_PER_SECOND)
         self._setup_logging()
+        self.session = self._get_authorized_session()
     
     def _setup_logging(self) -> None:
         """Set up logging configuration."""
@@ -66,6 +127,7 @@ class GooglePhotosClient:
                 credentials = self._authenticate()
             
             session = AuthorizedSession(credentials)
+            session.mount("https://", self._get_http_adapter())
             
             if self.auth_file:
                 try:
@@ -78,6 +140,34 @@ class GooglePhotosClient:
         except Exception as e:
             raise AuthenticationError(f"Failed to get authorized session: {e}")
     
+    def _get_http_adapter(self) -> HTTPAdapter:
+        """Get a pooled HTTP adapter that retries transient API failures.
+        
+        Returns:
+            HTTPAdapter: An adapter to mount on the authorized session
+        """
+        retry = _ApiRetry(
+            total=self.config.MAX_RETRIES,
+            # A read error may come after the server acted on the request
+            read=0,
+            backoff_factor=self.config.RETRY_DELAY,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(["GET", "POST"]),
+            raise_on_status=False,
+            rate_limiter=self.rate_limiter
+        )
+        # Every album thread runs its upload workers plus one batchCreate or
+        # offset query, so keep enough connections for all of them
+        pool_size = max(
+            self.config.POOL_SIZE,
+            self.config.MAX_CONCURRENT_ALBUMS * (self.config.MAX_CONCURRENT_UPLOADS + 1)
+        )
+        return HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retry
+        )
+    
     def _authenticate(self) -> Credentials:
         """Authenticate with Google Photos API.
         
@@ -87,6 +177,9 @@ class GooglePhotosClient:
         Raises:
             AuthenticationError: If authentication fails
         """
+        # Only needed when no saved tokens exist; importing it is slow
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        
         try:
             flow = InstalledAppFlow.from_client_secrets_file(
                 "client_id.json",
@@ -123,11 +216,29 @@ class GooglePhotosClient:
                 "client_secret": credentials.client_secret
             }
             
-            with open(self.auth_file, "w") as f:
-                json.dump(credentials_dict, f, indent=4)
+            if orjson is not None:
+                with open(self.auth_file, "wb") as f:
+                    f.write(orjson.dumps(credentials_dict, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.auth_file, "w") as f:
+                    json.dump(credentials_dict, f, indent=4)
         except Exception as e:
             raise AuthenticationError(f"Failed to save credentials: {e}")
     
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send an API request once the rate limiter allows it.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Further arguments for the session's request method
+            
+        Returns:
+            requests.Response: The API response
+        """
+        self.rate_limiter.acquire()
+        return self.session.request(method, url, **kwargs)
+    
     def get_albums(self, app_created_only: bool = False) -> Generator[dict, None, None]:
         """Get all albums from Google Photos.
         
@@ -140,12 +251,16 @@ class GooglePhotosClient:
         Raises:
             APIError: If the API request fails
         """
-        params = {"excludeNonAppCreatedData": app_created_only}
+        params = {
+            "excludeNonAppCreatedData": app_created_only,
+            "pageSize": self.config.ALBUM_PAGE_SIZE
+        }
         
         while True:
             try:
-                response = self.session.get(
-                    f"{self.config.API_BASE_URL}/albums",
+                response = self._request(
+                    "GET",
+                    self._albums_url,
                     params=params
                 )
                 response.raise_for_status()
@@ -165,6 +280,21 @@ class GooglePhotosClient:
             except Exception as e:
                 raise APIError(f"Failed to get albums: {e}")
     
+    def _ensure_album_index(self) -> None:
+        """Build the lower-cased title to ID index of app-created albums.
+        
+        The albums are listed once per client; later lookups and newly
+        created albums go through the index.
+        
+        Raises:
+            APIError: If the API request fails
+        """
+        if self._album_index is None:
+            album_index = {}
+            for album in self.get_albums(True):
+                album_index.setdefault(album["title"].lower(), album["id"])
+            self._album_index = album_index
+    
     def create_or_retrieve_album(self, album_title: str) -> Optional[str]:
         """Create a new album or retrieve an existing one.
         
@@ -178,34 +308,336 @@ class GooglePhotosClient:
             AlbumError: If album operations fail
         """
         try:
-            # Check for existing album
-            for album in self.get_albums(True):
-                if album["title"].lower() == album_title.lower():
+            # Serialized so concurrent albums with the same title create it once
+            with self._album_lock:
+                self._ensure_album_index()
+                album_id = self._album_index.get(album_title.lower())
+                if album_id:
                     self.logger.info(f"Using existing album: '{album_title}'")
-                    return album["id"]
+                    return album_id
+                
+                # Create new album
+                create_album_body = json.dumps(
+                    {"album": {"title": album_title}}, separators=(",", ":")
+                ).encode()
+                response = self._request(
+                    "POST",
+                    self._albums_url,
+                    data=create_album_body,
+                    headers={"Content-Type": "application/json"}
+                )
+                response.raise_for_status()
+                response_data = response.json()
+                
+                if "id" in response_data:
+                    self.logger.info(f"Created new album: '{album_title}'")
+                    self._album_index[album_title.lower()] = response_data["id"]
+                    return response_data["id"]
+                else:
+                    self.logger.error(f"Failed to create album '{album_title}': {response_data}")
+                    return None
+                
+        except Exception as e:
+            raise AlbumError(f"Album operation failed: {e}")
+    
+    def _upload_file(self, photo_file_name: str) -> Optional[str]:
+        """Upload the bytes of a single photo.
+        
+        Files whose content this client has already finished uploading reuse
+        the earlier upload token. Failures are logged rather than raised, so one
+        bad file does not stop the rest of the album.
+        
+        Args:
+            photo_file_name: Path of the photo to upload
             
-            # Create new album
-            create_album_body = json.dumps({"album": {"title": album_title}})
-            response = self.session.post(
-                f"{self.config.API_BASE_URL}/albums",
-                data=create_album_body
+        Returns:
+            str: The upload token, or None if the upload failed
+        """
+        try:
+            file_size = os.path.getsize(photo_file_name)
+            photo_file = open(photo_file_name, mode="rb")
+        except OSError as e:
+            self.logger.error(f"Could not read file '{photo_file_name}': {e}")
+            return None
+        
+        with photo_file:
+            try:
+                content_key = self._content_key(photo_file, file_size)
+                cached_token = self._get_cached_token(content_key, photo_file)
+                if cached_token:
+                    if self.logger.isEnabledFor(logging.INFO):
+                        self.logger.info(f"Reusing upload of identical photo: '{photo_file_name}'")
+                    return cached_token
+                
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info(f"Uploading photo: '{photo_file_name}'")
+                
+                content_hash = hashlib.blake2b()
+                upload_token_response = self._send_file(
+                    photo_file, photo_file_name, file_size, content_hash
+                )
+            except (OSError, ValueError, requests.RequestException, KeyError, UploadError) as e:
+                # Read errors and malformed upload responses, as well as failed requests
+                self.logger.error(f"Failed to upload '{os.path.basename(photo_file_name)}': {e}")
+                return None
+        
+        if not upload_token_response.content:
+            self.logger.error(
+                f"Failed to upload '{os.path.basename(photo_file_name)}': "
+                f"{upload_token_response}"
             )
-            response.raise_for_status()
-            response_data = response.json()
+            return None
+        
+        upload_token = upload_token_response.content.decode()
+        with self._token_cache_lock:
+            self._token_cache[content_key] = (
+                upload_token, content_hash.hexdigest(), time.monotonic()
+            )
+        return upload_token
+    
+    def _send_file(
+        self,
+        photo_file,
+        photo_file_name: str,
+        file_size: int,
+        content_hash
+    ) -> requests.Response:
+        """Send a file's bytes using the resumable upload protocol.
+        
+        The file is streamed in chunks of ``UPLOAD_CHUNK_SIZE`` bytes, so memory
+        use does not grow with the size of the photo or video. Each chunk is
+        read while the previous one is in flight. When a chunk fails, the
+        upload resumes from the offset the server reports having received.
+        The file is hashed as it is sent, so no separate read is needed.
+        
+        Args:
+            photo_file: Binary file object positioned at the start of the file
+            photo_file_name: Path of the photo, used to guess its MIME type
+            file_size: Size of the file in bytes
+            content_hash: hashlib object updated with the file's bytes as they are sent
             
-            if "id" in response_data:
-                self.logger.info(f"Created new album: '{album_title}'")
-                return response_data["id"]
-            else:
-                self.logger.error(f"Failed to create album '{album_title}': {response_data}")
-                return None
+        Returns:
+            requests.Response: The response to the final chunk, holding the upload token
+            
+        Raises:
+            requests.RequestException: If an upload request fails
+            KeyError: If the server does not return an upload URL
+            ValueError: If the server returns a malformed upload header
+            OSError: If the file cannot be read
+            UploadError: If an interrupted upload can no longer be resumed
+        """
+        start_headers = {
+            "X-Goog-Upload-Protocol": "resumable",
+            "X-Goog-Upload-Command": "start",
+            "X-Goog-Upload-Raw-Size": str(file_size)
+        }
+        mime_type, _ = mimetypes.guess_type(photo_file_name)
+        if mime_type:
+            start_headers["X-Goog-Upload-Content-Type"] = mime_type
+        
+        start_response = self._request(
+            "POST",
+            self._uploads_url,
+            headers=start_headers
+        )
+        start_response.raise_for_status()
+        upload_url = start_response.headers["X-Goog-Upload-URL"]
+        
+        # Every chunk but the last must be a multiple of the granularity
+        granularity = int(start_response.headers.get("X-Goog-Upload-Chunk-Granularity", 1))
+        chunk_size = max(granularity, self.config.UPLOAD_CHUNK_SIZE // granularity * granularity)
+        
+        # Read the next chunk from disk while the current one is being sent
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            next_chunk = prefetcher.submit(photo_file.read, chunk_size)
+            offset = 0
+            hashed_size = 0
+            resume_attempts = 0
+            while True:
+                chunk = next_chunk.result()
+                # Hash each byte once, even when resuming re-sends part of the file
+                if offset <= hashed_size < offset + len(chunk):
+                    content_hash.update(chunk[hashed_size - offset:])
+                    hashed_size = offset + len(chunk)
+                is_last_chunk = not chunk or offset + len(chunk) >= file_size
+                if not is_last_chunk:
+                    next_chunk = prefetcher.submit(photo_file.read, chunk_size)
                 
-        except Exception as e:
-            raise AlbumError(f"Album operation failed: {e}")
+                try:
+                    upload_token_response = self._request(
+                        "POST",
+                        upload_url,
+                        data=chunk,
+                        headers={
+                            "X-Goog-Upload-Command": "upload, finalize" if is_last_chunk else "upload",
+                            "X-Goog-Upload-Offset": str(offset)
+                        }
+                    )
+                    upload_token_response.raise_for_status()
+                except requests.RequestException as e:
+                    if resume_attempts >= self.config.MAX_RETRIES:
+                        raise
+                    resume_attempts += 1
+                    self.logger.warning(
+                        f"Upload of '{os.path.basename(photo_file_name)}' interrupted "
+                        f"at byte {offset}, resuming: {e}"
+                    )
+                    
+                    # Part of the chunk may have been stored; continue from
+                    # wherever the server says it got to
+                    if not is_last_chunk:
+                        next_chunk.result()
+                    offset = self._query_upload_offset(upload_url)
+                    photo_file.seek(offset)
+                    next_chunk = prefetcher.submit(photo_file.read, chunk_size)
+                    continue
+                
+                if is_last_chunk:
+                    break
+                offset += len(chunk)
+        
+        return upload_token_response
+    
+    def _query_upload_offset(self, upload_url: str) -> int:
+        """Ask the server how many bytes of an interrupted upload it has received.
+        
+        Args:
+            upload_url: URL of the resumable upload session
+            
+        Returns:
+            int: Offset to continue the upload from
+            
+        Raises:
+            requests.RequestException: If the query request fails
+            KeyError: If the server does not report the received size
+            ValueError: If the reported size is malformed
+            UploadError: If the upload session is no longer active
+        """
+        response = self._request(
+            "POST",
+            upload_url,
+            headers={"X-Goog-Upload-Command": "query"}
+        )
+        response.raise_for_status()
+        
+        status = response.headers.get("X-Goog-Upload-Status")
+        if status != "active":
+            raise UploadError(f"Upload session is no longer active: {status}")
+        return int(response.headers["X-Goog-Upload-Size-Received"])
+    
+    @staticmethod
+    def _content_key(photo_file, file_size: int) -> str:
+        """Compute a cheap content key from a file's size and its first and last bytes.
+        
+        Args:
+            photo_file: Binary file object positioned at the start of the file
+            file_size: Size of the file in bytes
+            
+        Returns:
+            str: Hex digest identifying the file's content
+        """
+        content_hash = hashlib.blake2b(str(file_size).encode(), digest_size=16)
+        content_hash.update(photo_file.read(_CONTENT_KEY_SAMPLE_SIZE))
+        if file_size > _CONTENT_KEY_SAMPLE_SIZE:
+            photo_file.seek(max(_CONTENT_KEY_SAMPLE_SIZE, file_size - _CONTENT_KEY_SAMPLE_SIZE))
+            content_hash.update(photo_file.read(_CONTENT_KEY_SAMPLE_SIZE))
+        photo_file.seek(0)
+        return content_hash.hexdigest()
+    
+    def _get_cached_token(self, content_key: str, photo_file) -> Optional[str]:
+        """Get the upload token of an earlier upload with the same content.
+        
+        The content key only samples the file, so a match is confirmed by
+        comparing full-file digests before the token is reused; only likely
+        duplicates pay for reading the whole file.
+        
+        Only finished uploads are cached. Duplicates uploaded at the same time,
+        e.g. two copies of a photo in one album, are both uploaded.
+        
+        Args:
+            content_key: Content key of the file to upload
+            photo_file: Binary file object positioned at the start of the file
+            
+        Returns:
+            str: The upload token, or None if there is no unexpired upload
+        """
+        with self._token_cache_lock:
+            cached = self._token_cache.get(content_key)
+            if cached is None:
+                return None
+            
+            upload_token, content_digest, uploaded_at = cached
+            if time.monotonic() - uploaded_at > self.config.UPLOAD_TOKEN_TTL:
+                del self._token_cache[content_key]
+                return None
+        
+        content_hash = hashlib.blake2b()
+        for chunk in iter(lambda: photo_file.read(self.config.UPLOAD_CHUNK_SIZE), b""):
+            content_hash.update(chunk)
+        photo_file.seek(0)
+        
+        if content_hash.hexdigest() != content_digest:
+            return None
+        return upload_token
+    
+    def _create_media_items(
+        self,
+        uploaded: List[Tuple[str, str]],
+        album_id: Optional[str],
+        album_name: Optional[str]
+    ) -> None:
+        """Create media items from upload tokens with a single batchCreate call.
+        
+        Args:
+            uploaded: (file name, upload token) pairs, at most BATCH_CREATE_SIZE
+            album_id: Optional ID of the album to add the media items to
+            album_name: Optional name of the album, for logging
+        """
+        create_body = json.dumps({
+            "albumId": album_id,
+            "newMediaItems": [
+                {
+                    "description": "",
+                    "simpleMediaItem": {"uploadToken": upload_token, "fileName": file_name}
+                }
+                for file_name, upload_token in uploaded
+            ]
+        }, separators=(",", ":")).encode()
+        
+        media_item_response = self._request(
+            "POST",
+            self._batch_create_url,
+            data=create_body,
+            headers={"Content-Type": "application/json"}
+        )
+        media_item_response.raise_for_status()
+        media_item_data = media_item_response.json()
+        
+        if "newMediaItemResults" not in media_item_data:
+            self.logger.error(
+                f"Failed to add {len(uploaded)} photos to library: {media_item_data}"
+            )
+            return
+        
+        # Results are in request order; tokens can repeat when files were deduplicated
+        for (file_name, _), result in zip(uploaded, media_item_data["newMediaItemResults"]):
+            status = result.get("status", {})
+            if status.get("code") and status.get("code") > 0:
+                self.logger.error(
+                    f"Failed to add '{file_name}' to library: {status.get('message')}"
+                )
+            elif self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    f"Added '{file_name}' to library and album '{album_name}'"
+                )
     
     def upload_photos(self, photo_file_list: List[str], album_name: Optional[str] = None) -> None:
         """Upload photos to Google Photos.
         
+        Up to ``MAX_CONCURRENT_UPLOADS`` photos are uploaded at once. Media
+        items are created in the order the photos were given, in batches of
+        up to ``BATCH_CREATE_SIZE`` while later photos are still uploading.
+        
         Args:
             photo_file_list: List of photo file paths to upload
             album_name: Optional name of the album to upload to
@@ -219,87 +651,57 @@ class GooglePhotosClient:
             if album_name and not album_id:
                 return
             
-            self.session.headers.update({
-                "Content-type": "application/octet-stream",
-                "X-Goog-Upload-Protocol": "raw"
-            })
-            
-            for photo_file_name in photo_file_list:
+            tokens_buf = []
+            with ThreadPoolExecutor(max_workers=self.config.MAX_CONCURRENT_UPLOADS) as executor:
+                upload_tokens = executor.map(self._upload_file, photo_file_list)
                 try:
-                    with open(photo_file_name, mode="rb") as photo_file:
-                        photo_bytes = photo_file.read()
-                except OSError as e:
-                    self.logger.error(f"Could not read file '{photo_file_name}': {e}")
-                    continue
-                
-                self.session.headers["X-Goog-Upload-File-Name"] = os.path.basename(photo_file_name)
-                self.logger.info(f"Uploading photo: '{photo_file_name}'")
-                
-                # Upload with retries
-                for attempt in range(self.config.MAX_RETRIES):
-                    try:
-                        upload_token_response = self.session.post(
-                            f"{self.config.API_BASE_URL}/uploads",
-                            data=photo_bytes
-                        )
-                        upload_token_response.raise_for_status()
-                        break
-                    except Exception as e:
-                        if attempt == self.config.MAX_RETRIES - 1:
-                            raise
-                        self.logger.warning(f"Upload attempt {attempt + 1} failed: {e}")
-                        sleep(self.config.RETRY_DELAY)
-                
-                if upload_token_response.content:
-                    upload_token = upload_token_response.content.decode()
-                    create_body = json.dumps({
-                        "albumId": album_id,
-                        "newMediaItems": [{
-                            "description": "",
-                            "simpleMediaItem": {"uploadToken": upload_token}
-                        }]
-                    })
-                    
-                    media_item_response = self.session.post(
-                        f"{self.config.API_BASE_URL}/mediaItems:batchCreate",
-                        data=create_body
-                    )
-                    media_item_response.raise_for_status()
-                    media_item_data = media_item_response.json()
-                    
-                    if "newMediaItemResults" in media_item_data:
-                        status = media_item_data["newMediaItemResults"][0]["status"]
-                        if status.get("code") and status.get("code") > 0:
-                            self.logger.error(
-                                f"Failed to add '{os.path.basename(photo_file_name)}' "
-                                f"to library: {status['message']}"
-                            )
-                        else:
-                            self.logger.info(
-                                f"Added '{os.path.basename(photo_file_name)}' "
-                                f"to library and album '{album_name}'"
-                            )
-                    else:
-                        self.logger.error(
-                            f"Failed to add '{os.path.basename(photo_file_name)}' "
-                            f"to library: {media_item_data}"
-                        )
-                else:
-                    self.logger.error(
-                        f"Failed to upload '{os.path.basename(photo_file_name)}': "
-                        f"{upload_token_response}"
-                    )
+                    # Create each batch as soon as its uploads are done, so an
+                    # interrupted album keeps the media items created so far
+                    for photo_file_name, upload_token in zip(photo_file_list, upload_tokens):
+                        if not upload_token:
+                            continue
+                        
+                        tokens_buf.append((os.path.basename(photo_file_name), upload_token))
+                        if len(tokens_buf) >= self.config.BATCH_CREATE_SIZE:
+                            self._create_media_items(tokens_buf, album_id, album_name)
+                            tokens_buf.clear()
+                finally:
+                    # Cancels uploads not yet started if batch creation failed
+                    upload_tokens.close()
             
-            # Clean up headers
-            for header in ["Content-type", "X-Goog-Upload-Protocol", "X-Goog-Upload-File-Name"]:
-                self.session.headers.pop(header, None)
+            if tokens_buf:
+                self._create_media_items(tokens_buf, album_id, album_name)
                 
         except Exception as e:
             raise UploadError(f"Photo upload failed: {e}")
     
+    def _upload_album(self, album_path: str, album_name: str) -> None:
+        """Upload the photos directly inside a directory to an album.
+        
+        Args:
+            album_path: Path to the album directory
+            album_name: Name of the album to upload to
+            
+        Raises:
+            UploadError: If photo upload fails
+        """
+        self.logger.info(f"Processing album: {album_name}")
+        
+        with os.scandir(album_path) as entries:
+            photo_entries = [
+                entry for entry in entries if entry.is_file()
+            ]
+        photo_entries.sort(key=lambda entry: entry.name)
+        photo_paths = [os.path.abspath(entry.path) for entry in photo_entries]
+        
+        self.upload_photos(photo_paths, album_name)
+    
     def upload_photos_from_directory(self, root_directory: str) -> None:
         """Upload photos from a directory structure to Google Photos.
         
+        Every subdirectory becomes an album; up to ``MAX_CONCURRENT_ALBUMS``
+        albums are uploaded at once.
+        
         Args:
             root_directory: Path to the root directory containing photo albums
             
@@ -307,17 +709,18 @@ class GooglePhotosClient:
             UploadError: If photo upload fails
         """
         try:
-            for subdirectory, subdirectories, _ in os.walk(root_directory):
-                for album_name in subdirectories:
-                    album_path = os.path.join(subdirectory, album_name)
-                    self.logger.info(f"Processing album: {album_name}")
-                    
-                    photo_paths = [
-                        os.path.abspath(os.path.join(album_path, photo_filename))
-                        for photo_filename in sorted(os.listdir(album_path))
-                    ]
-                    
-                    self.upload_photos(photo_paths, album_name)
+            # List existing albums once up front; each album below then costs a
+            # dict lookup plus at most one create request
+            self._ensure_album_index()
+            
+            album_paths = [
+                (os.path.join(subdirectory, album_name), album_name)
+                for subdirectory, subdirectories, _ in os.walk(root_directory)
+                for album_name in subdirectories
+            ]
+            
+            with ThreadPoolExecutor(max_workers=self.config.MAX_CONCURRENT_ALBUMS) as executor:
+                list(executor.map(lambda album: self._upload_album(*album), album_paths))
                     
         except Exception as e:
             raise UploadError(f"Directory upload failed: {e}") 
\ No newline at end of file
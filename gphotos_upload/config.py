@@ -2,18 +2,21 @@
 
 import os
 from dataclasses import dataclass
-from typing import List
+from functools import lru_cache
+from typing import Tuple
 
-@dataclass
+@dataclass(frozen=True)
 class Config:
     """Configuration settings for the Google Photos Upload tool."""
     
     # API Configuration
     API_BASE_URL: str = "https://photoslibrary.googleapis.com/v1"
-    SCOPES: List[str] = [
+    SCOPES: Tuple[str, ...] = (
         "https://www.googleapis.com/auth/photoslibrary",
         "https://www.googleapis.com/auth/photoslibrary.sharing"
-    ]
+    )
+    ALBUM_PAGE_SIZE: int = 50  # API maximum per albums.list page (default 20)
+    REQUESTS_PER_SECOND: int = 10  # 0 disables client-side rate limiting
     
     # Authentication
     AUTH_PORT: int = 8080
@@ -22,7 +25,13 @@ class Config:
     
     # Upload Configuration
     MAX_RETRIES: int = 3
-    RETRY_DELAY: int = 5  # seconds
+    RETRY_DELAY: int = 1  # seconds, base of the exponential retry backoff
+    MAX_CONCURRENT_UPLOADS: int = 4
+    MAX_CONCURRENT_ALBUMS: int = 4
+    BATCH_CREATE_SIZE: int = 50  # API maximum per mediaItems:batchCreate call
+    POOL_SIZE: int = 16  # minimum keep-alive connections to the API host
+    UPLOAD_CHUNK_SIZE: int = 8 * 1024 * 1024  # bytes per resumable upload request
+    UPLOAD_TOKEN_TTL: int = 23 * 60 * 60  # seconds; upload tokens expire after a day
     
     # Logging
     LOG_FORMAT: str = "%(asctime)s %(module)s.%(funcName)s:%(levelname)s:%(message)s"
@@ -30,13 +39,27 @@ class Config:
     DEFAULT_LOG_LEVEL: str = "INFO"
     
     @classmethod
+    @lru_cache(maxsize=None)
     def from_env(cls) -> "Config":
-        """Create a Config instance from environment variables."""
+        """Create a Config instance from environment variables.
+        
+        The environment is read once; later calls return the same frozen instance.
+        """
         return cls(
             API_BASE_URL=os.getenv("GPHOTOS_API_BASE_URL", cls.API_BASE_URL),
+            REQUESTS_PER_SECOND=int(os.getenv(
+                "GPHOTOS_REQUESTS_PER_SECOND", str(cls.REQUESTS_PER_SECOND)
+            )),
             AUTH_PORT=int(os.getenv("GPHOTOS_AUTH_PORT", str(cls.AUTH_PORT))),
             AUTH_HOST=os.getenv("GPHOTOS_AUTH_HOST", cls.AUTH_HOST),
             MAX_RETRIES=int(os.getenv("GPHOTOS_MAX_RETRIES", str(cls.MAX_RETRIES))),
             RETRY_DELAY=int(os.getenv("GPHOTOS_RETRY_DELAY", str(cls.RETRY_DELAY))),
+            MAX_CONCURRENT_UPLOADS=int(os.getenv(
+                "GPHOTOS_MAX_CONCURRENT_UPLOADS", str(cls.MAX_CONCURRENT_UPLOADS)
+            )),
+            MAX_CONCURRENT_ALBUMS=int(os.getenv(
+                "GPHOTOS_MAX_CONCURRENT_ALBUMS", str(cls.MAX_CONCURRENT_ALBUMS)
+            )),
+            POOL_SIZE=int(os.getenv("GPHOTOS_POOL_SIZE", str(cls.POOL_SIZE))),
             DEFAULT_LOG_LEVEL=os.getenv("GPHOTOS_LOG_LEVEL", cls.DEFAULT_LOG_LEVEL)
         ) 
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""Rate limiting for Google Photos API requests."""
+
+import threading
+import time
+from typing import Optional
+
+class RateLimiter:
+    """Thread-safe token bucket that throttles outgoing requests."""
+
+    def __init__(self, requests_per_second: float, burst_allowance: Optional[int] = None):
+        """Initialize the rate limiter.
+
+        Args:
+            requests_per_second: Sustained request rate; 0 or less disables limiting
+            burst_allowance: Requests that may be sent back to back after an idle
+                period, defaults to one second's worth
+        """
+        self.requests_per_second = requests_per_second
+        self.burst_allowance = (
+            burst_allowance if burst_allowance is not None
+            else max(1, int(requests_per_second))
+        )
+        self._tokens = float(self.burst_allowance)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        if self.requests_per_second <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst_allowance,
+                self._tokens + (now - self._updated_at) * self.requests_per_second
+            )
+            self._updated_at = now
+            # Reserve a token now and wait outside the lock for it to refill,
+            # so callers are released in the order they arrived
+            self._tokens -= 1
+            wait = -self._tokens / self.requests_per_second
+
+        if wait > 0:
+            time.sleep(wait)
@@ -30,6 +30,9 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=requirements,
+    extras_require={
+        "fast": ["orjson>=3.0.0"],
+    },
     entry_points={
         "console_scripts": [
             "gphotos-upload=gphotos_upload.__main__:main",